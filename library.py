@@ -1,250 +1,607 @@
-import json
-import os
-
-DATA_FILE = 'data.json'
-
-class Book:
-    """
-    Класс для представления книги в библиотеке.
-
-    Attributes:
-        id (int): Уникальный идентификатор книги.
-        title (str): Название книги.
-        author (str): Автор книги.
-        year (int): Год издания книги.
-        status (str): Статус книги (в наличии/выдана).
-    """
-
-    def __init__(self, id: int, title: str, author: str, year: int, status='в наличии'):
-        """
-        Инициализирует новую книгу.
-
-        Args:
-            id (int): Уникальный идентификатор книги.
-            title (str): Название книги.
-            author (str): Автор книги.
-            year (int): Год издания книги.
-            status (str, optional): Статус книги. По умолчанию - 'в наличии'.
-        """
-        self.id = id
-        self.title = title
-        self.author = author
-        self.year = year
-        self.status = status
-
-    def to_dict(self):
-        """
-        Возвращает словарь, представляющий книгу.
-
-        Returns:
-            dict: Словарь, представляющий книгу.
-        """
-        return {
-            'id': self.id,
-            'title': self.title,
-            'author': self.author,
-            'year': self.year,
-            'status': self.status
-        }
-
-class Services:
-    """
-    Класс для обслуживания данных библиотеки.
-
-    Attributes:
-        data_file (str): Путь к файлу с данными библиотеки.
-    """
-
-    def __init__(self, data_file: str):
-        """
-        Инициализирует новые обслуживающие данные.
-
-        Args:
-            data_file (str): Путь к файлу с данными библиотеки.
-        """
-        self.data_file = data_file
-
-    def load_data(self):
-        """
-        Загружает данные из файла и преобразует их в объекты Book.
-
-        Returns:
-            list: Список объектов Book.
-        """
-        if not os.path.exists(self.data_file) or os.stat(self.data_file).st_size == 0:
-            print("Файл data.json не существует или пуст")
-            return []
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                return [Book(**book) for book in data]
-        except json.JSONDecodeError:
-            print("Файл data.json повреждён")
-            return []
-
-    def save_data(self, books):
-        """
-        Преобразует объекты Book обратно в словари и сохраняет их в файл в формате JSON.
-
-        Args:
-            books (list): Список объектов Book.
-        """
-        with open(self.data_file, 'w', encoding='utf-8') as file:
-            json.dump([book.to_dict() for book in books], file, indent=4, ensure_ascii=False)
-
-class Library:
-    """
-    Класс для представления библиотеки.
-
-    Attributes:
-        data_file (str): Путь к файлу с данными библиотеки.
-        services (Services): Объект класса Services для обслуживания данных библиотеки.
-        books (list): Список объектов Book в библиотеке.
-    """
-
-    def __init__(self, data_file: str):
-        """
-        Инициализирует новую библиотеку.
-
-        Args:
-            data_file (str): Путь к файлу с данными библиотеки.
-        """
-        self.services = Services(data_file)
-        self.books = self.services.load_data()
-
-    def generate_id(self):
-        """
-        Возвращает новый уникальный идентификатор для книги.
-
-        Returns:
-            int: Новый уникальный идентификатор для книги.
-        """
-        return max([book.id for book in self.books], default=0) + 1
-
-    def add_book(self, title: str, author: str, year: int):
-        """
-        Добавляет новую книгу в библиотеку.
-
-        Args:
-            title (str): Название книги.
-            author (str): Автор книги.
-            year (int): Год издания книги.
-        """
-        new_book = Book(self.generate_id(), title, author, year)
-        self.books.append(new_book)
-        self.services.save_data(self.books)
-        print(f"Книга '{title}' добавлена с ID {new_book.id}.")
-
-    def delete_book(self, book_id: int):
-        """
-        Удаляет книгу из библиотеки.
-
-        Args:
-            book_id (int): Уникальный идентификатор книги.
-        """
-        book_exists = any(book.id == book_id for book in self.books)
-        if not book_exists:
-            print(f"Книга с ID {book_id} не найдена.")
-            return
-        self.books = [book for book in self.books if book.id != book_id]
-        self.services.save_data(self.books)
-        print(f"Книга с ID {book_id} удалена.")
-
-    def search_books(self, query: str, field: str):
-        """
-        Ищет книги в библиотеке по указанному полю и запросу.
-
-        Args:
-            query (str): Запрос для поиска.
-            field (str): Поле для поиска. Должно быть одним из 'title', 'author', 'year'.
-        """
-        results = [book for book in self.books if query.lower() in getattr(book, field).lower()]
-        if results:
-            for book in results:
-                print(book.to_dict())
-        else:
-            print(f"Книги по запросу '{query}' не найдены.")
-
-    def display_books(self):
-        """
-        Отображает все книги в библиотеке.
-        """
-        if self.books:
-            for book in self.books:
-                print(book.to_dict())
-        else:
-            print("В библиотеке нет книг.")
-
-    def change_status(self, book_id: int, new_status: str):
-        """
-        Изменяет статус книги в библиотеке.
-
-        Args:
-            book_id (int): Уникальный идентификатор книги.
-            new_status (str): Новый статус книги. Должен быть одним из 'в наличии', 'выдана'.
-        """
-        if new_status not in ['в наличии', 'выдана']:
-            print("Некорректный статус. Доступные статусы: 'в наличии', 'выдана'.")
-            return
-        for book in self.books:
-            if book.id == book_id:
-                book.status = new_status
-                self.services.save_data(self.books)
-                print(f"Статус книги с ID {book_id} изменен на '{new_status}'.")
-                return
-        print(f"Книга с ID {book_id} не найдена.")
-
-def main():
-    library = Library(DATA_FILE)
-
-    while True:
-        print("\nМеню:")
-        print("1. Добавить книгу")
-        print("2. Удалить книгу")
-        print("3. Искать книгу")
-        print("4. Показать все книги")
-        print("5. Изменить статус книги")
-        print("6. Выйти")
-        choice = input("Выберите опцию: ")
-
-        if choice == '1':
-            title = input("Введите название книги: ")
-            if any(book.title.encode('utf-8').decode('utf-8') == title for book in library.books):
-                print(f"Книга с названием '{title}' уже существует.")
-                title = input("Введите название книги ещё раз: ")
-            author = input("Введите автора книги: ")
-            year = input("Введите год издания книги: ")
-            if not year.isdigit():
-                year = input("Год должен быть числом!\nВведите год издания ещё раз: ")
-            library.add_book(title, author, int(year))
-        elif choice == '2':
-            try:
-                book_id = int(input("Введите ID книги для удаления: "))
-                library.delete_book(book_id)
-            except ValueError:
-                print("Некорректный ID.")
-        elif choice == '3':
-            field = input("Введите поле для поиска из (title/author/year): ").strip().lower()
-            #Так как мы отображем ID при добавлении книги, считаю, что было бы хорошо добавить поиск и по ID
-            if field in ['title', 'author', 'year']:
-                query = input(f"Введите {field}: ").strip()
-                library.search_books(query, field)
-            else:
-                print("Некорректное поле для поиска.")
-        elif choice == '4':
-            library.display_books()
-        elif choice == '5':
-            try:
-                book_id = int(input("Введите ID книги для изменения статуса: "))
-                #Мне кажется, логичнее не спрашивать какой статус хочет установить пользователь, так как вариант всего 1)
-                new_status = input("Введите новый статус (в наличии/выдана): ").strip().lower()
-                library.change_status(book_id, new_status)
-            except ValueError:
-                print("Некорректный ID.")
-        elif choice == '6':
-            break
-        else:
-            print("Выберите цифру от 1 до 6")
-
-if __name__ == "__main__":
-    main()
+import array
+import bisect
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Ошибки разбора данных: у ijson свой базовый класс исключений,
+# который не наследуется от ValueError.
+if ijson is not None:
+    PARSE_ERRORS = (ValueError, ijson.JSONError)
+else:
+    PARSE_ERRORS = (ValueError,)
+
+DATA_FILE = 'data.json'
+
+# Статусы книги; внутри храним индекс в этом кортеже, а не строку.
+STATUSES = ('в наличии', 'выдана')
+
+# Порог размера файла, начиная с которого load_data читает его потоково,
+# чтобы не держать в памяти весь документ плюс промежуточные словари.
+STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Максимальное число запомненных результатов поиска на библиотеку.
+SEARCH_CACHE_SIZE = 256
+
+# Кэш результатов load_data: (путь, mtime_ns, размер) -> список Book.
+# Позволяет не разбирать файл заново, если он не менялся.
+_LOAD_CACHE = {}
+
+class Book:
+    """
+    Класс для представления книги в библиотеке.
+
+    Attributes:
+        id (int): Уникальный идентификатор книги.
+        title (str): Название книги.
+        author (str): Автор книги.
+        year (int): Год издания книги.
+        status (int): Статус книги - индекс в STATUSES (0 - в наличии, 1 - выдана).
+    """
+
+    __slots__ = ('id', 'title', 'author', 'year', 'status')
+
+    def __init__(self, id: int, title: str, author: str, year: int, status=0):
+        """
+        Инициализирует новую книгу.
+
+        Args:
+            id (int): Уникальный идентификатор книги.
+            title (str): Название книги.
+            author (str): Автор книги.
+            year (int): Год издания книги.
+            status (int | str, optional): Статус книги - индекс в STATUSES
+                либо сама строка статуса. По умолчанию - 'в наличии'.
+        """
+        self.id = id
+        self.title = title
+        # Авторы часто повторяются: интернирование даёт общий str-объект
+        # на все книги одного автора вместо копии на каждую.
+        self.author = sys.intern(author)
+        try:
+            self.year = int(year)
+        except (TypeError, ValueError):
+            raise ValueError(f"Некорректный год издания: {year!r}")
+        # Колонка годов в Library - массив int16, выход за его диапазон
+        # уронил бы append с OverflowError.
+        if not -32768 <= self.year <= 32767:
+            raise ValueError(f"Год издания вне допустимого диапазона: {year!r}")
+        self.status = status if isinstance(status, int) else STATUSES.index(status)
+
+    def to_dict(self):
+        """
+        Возвращает словарь, представляющий книгу.
+
+        Returns:
+            dict: Словарь, представляющий книгу.
+        """
+        return {
+            'id': self.id,
+            'title': self.title,
+            'author': self.author,
+            'year': self.year,
+            'status': STATUSES[self.status]
+        }
+
+class Services:
+    """
+    Класс для обслуживания данных библиотеки.
+
+    Attributes:
+        data_file (str): Путь к файлу с данными библиотеки.
+        format (str): Формат хранения данных ('json' или 'msgpack').
+    """
+
+    def __init__(self, data_file: str):
+        """
+        Инициализирует новые обслуживающие данные. Формат хранения
+        определяется по расширению файла: .mpk/.msgpack - бинарный
+        MessagePack (компактнее и быстрее разбирается), иначе JSON.
+
+        Args:
+            data_file (str): Путь к файлу с данными библиотеки.
+        """
+        self.data_file = data_file
+        if msgpack is not None and data_file.endswith(('.mpk', '.msgpack')):
+            self.format = 'msgpack'
+        else:
+            self.format = 'json'
+
+    def load_data(self):
+        """
+        Загружает данные из файла и преобразует их в объекты Book.
+
+        Returns:
+            list: Список объектов Book.
+        """
+        try:
+            st = os.stat(self.data_file)
+        except FileNotFoundError:
+            print("Файл data.json не существует или пуст")
+            return []
+        if st.st_size == 0:
+            print("Файл data.json не существует или пуст")
+            return []
+        cache_key = (self.data_file, st.st_mtime_ns, st.st_size)
+        if cache_key in _LOAD_CACHE:
+            return list(_LOAD_CACHE[cache_key])
+        try:
+            if self.format == 'msgpack':
+                with open(self.data_file, 'rb') as file:
+                    data = msgpack.unpackb(file.read(), raw=False)
+                books = [Book(**book) for book in data]
+                _LOAD_CACHE[cache_key] = books
+                return list(books)
+            if ijson is not None and st.st_size >= STREAM_THRESHOLD:
+                with open(self.data_file, 'rb') as file:
+                    books = [Book(**book) for book in ijson.items(file, 'item')]
+            else:
+                with open(self.data_file, 'rb') as file:
+                    raw = file.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                books = [Book(**book) for book in data]
+            _LOAD_CACHE[cache_key] = books
+            return list(books)
+        except PARSE_ERRORS:
+            print("Файл data.json повреждён")
+            return []
+
+    def save_data(self, books):
+        """
+        Преобразует объекты Book обратно в словари и сохраняет их в файл в формате JSON.
+
+        Args:
+            books (list): Список объектов Book.
+        """
+        if self.format == 'msgpack':
+            payload = msgpack.packb([book.to_dict() for book in books], use_bin_type=True)
+            self._write_atomic(payload)
+            self._invalidate_cache()
+            return
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'wb') as file:
+            file.write(b'[\n')
+            for i, book in enumerate(books):
+                if i:
+                    file.write(b',\n')
+                record = book.to_dict()
+                if orjson is not None:
+                    file.write(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+                else:
+                    file.write(json.dumps(record, indent=4, ensure_ascii=False).encode('utf-8'))
+            file.write(b'\n]')
+        os.replace(tmp_file, self.data_file)
+        self._invalidate_cache()
+
+    def _write_atomic(self, payload: bytes):
+        """
+        Атомарно записывает данные: одним вызовом write во временный файл,
+        затем os.replace, чтобы при сбое не остался повреждённый файл.
+
+        Args:
+            payload (bytes): Сериализованные данные.
+        """
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_file, self.data_file)
+
+    def _invalidate_cache(self):
+        """
+        Удаляет из кэша load_data устаревшие записи для этого файла.
+        """
+        for key in [key for key in _LOAD_CACHE if key[0] == self.data_file]:
+            del _LOAD_CACHE[key]
+
+class Library:
+    """
+    Класс для представления библиотеки.
+
+    Данные хранятся по колонкам (структура массивов): параллельные списки
+    ids/titles/authors/years/statuses. Объекты Book создаются только как
+    представления строк при выдаче результатов.
+
+    Attributes:
+        data_file (str): Путь к файлу с данными библиотеки.
+        services (Services): Объект класса Services для обслуживания данных библиотеки.
+        ids (list): Список идентификаторов книг.
+        titles (list): Список названий книг.
+        authors (list): Список авторов книг.
+        years (array.array): Массив годов издания книг (int16).
+        statuses (list): Список статусов книг.
+    """
+
+    def __init__(self, data_file: str):
+        """
+        Инициализирует новую библиотеку.
+
+        Args:
+            data_file (str): Путь к файлу с данными библиотеки.
+        """
+        self.services = Services(data_file)
+        loaded = self.services.load_data()
+        self.ids = [book.id for book in loaded]
+        self.titles = [book.title for book in loaded]
+        self.authors = [book.author for book in loaded]
+        # Годы лежат в компактном массиве int16 (2 байта на книгу)
+        # вместо списка полноценных int-объектов.
+        self.years = array.array('h', (book.year for book in loaded))
+        self.statuses = [book.status for book in loaded]
+        self._by_id = {book_id: i for i, book_id in enumerate(self.ids)}
+        self._max_id = max(self.ids, default=0)
+        self._rebuild_search_index()
+        self._arrow_columns = None
+        self._search_cache = {}
+        self._dirty = False
+        self._autoflush = True
+
+    @property
+    def books(self):
+        """
+        Возвращает список объектов Book, собранных из колонок.
+
+        Returns:
+            list: Список объектов Book.
+        """
+        return [self._book_at(i) for i in range(len(self.ids))]
+
+    def _book_at(self, i: int):
+        """
+        Собирает объект Book из колонок по индексу строки.
+
+        Args:
+            i (int): Индекс строки.
+
+        Returns:
+            Book: Объект Book.
+        """
+        return Book(self.ids[i], self.titles[i], self.authors[i],
+                    self.years[i], self.statuses[i])
+
+    def _rebuild_search_index(self):
+        """
+        Перестраивает поисковые индексы: колонки полей в нижнем регистре
+        и отсортированный индекс названий.
+        """
+        self._lc_titles = [title.casefold() for title in self.titles]
+        self._lc_authors = [author.casefold() for author in self.authors]
+        self._str_years = [str(year) for year in self.years]
+        self._sorted_titles = sorted((t, i) for i, t in enumerate(self._lc_titles))
+
+    def _title_prefix_indexes(self, prefix: str):
+        """
+        Возвращает индексы строк, названия которых начинаются с prefix.
+        Двоичный поиск по отсортированному индексу названий: O(log N + k)
+        вместо полного прохода по всем книгам.
+
+        Args:
+            prefix (str): Префикс названия.
+
+        Returns:
+            list: Список индексов подходящих строк.
+        """
+        q = prefix.casefold()
+        start = bisect.bisect_left(self._sorted_titles, (q,))
+        indexes = []
+        for pos in range(start, len(self._sorted_titles)):
+            lc_title, i = self._sorted_titles[pos]
+            if not lc_title.startswith(q):
+                break
+            indexes.append(i)
+        return indexes
+
+    def title_exists(self, title: str):
+        """
+        Проверяет, есть ли в библиотеке книга с таким названием.
+
+        Args:
+            title (str): Название книги.
+
+        Returns:
+            bool: True, если книга с таким названием уже есть.
+        """
+        return any(self.titles[i] == title for i in self._title_prefix_indexes(title))
+
+    def _substring_indexes(self, field: str, q: str):
+        """
+        Возвращает индексы строк, где q входит в указанную колонку.
+        При наличии pyarrow поиск подстроки выполняется векторизованно
+        на C-уровне, иначе - обычным проходом по списку.
+
+        Args:
+            field (str): Имя колонки ('title' или 'author').
+            q (str): Запрос в нижнем регистре.
+
+        Returns:
+            list: Список индексов подходящих строк.
+        """
+        column_lc = self._lc_titles if field == 'title' else self._lc_authors
+        if pc is None:
+            return [i for i, s in enumerate(column_lc) if q in s]
+        if self._arrow_columns is None:
+            self._arrow_columns = {
+                'title': pa.array(self._lc_titles, type=pa.string()),
+                'author': pa.array(self._lc_authors, type=pa.string()),
+            }
+        mask = pc.match_substring(self._arrow_columns[field], q)
+        return [i for i, hit in enumerate(mask) if hit.as_py()]
+
+    def _mark_dirty(self):
+        """
+        Помечает данные как изменённые и сохраняет их, если включена автозапись.
+        """
+        self._dirty = True
+        self._arrow_columns = None
+        self._search_cache.clear()
+        if self._autoflush:
+            self.flush()
+
+    def flush(self):
+        """
+        Сохраняет данные в файл, если они были изменены.
+        """
+        if self._dirty:
+            self.services.save_data(self.books)
+            self._dirty = False
+
+    @contextmanager
+    def bulk(self):
+        """
+        Контекстный менеджер для массовых операций: откладывает запись
+        в файл до выхода из блока, чтобы не переписывать файл на каждой операции.
+        """
+        self._autoflush = False
+        try:
+            yield self
+        finally:
+            self._autoflush = True
+            self.flush()
+
+    def generate_id(self):
+        """
+        Возвращает новый уникальный идентификатор для книги.
+
+        Returns:
+            int: Новый уникальный идентификатор для книги.
+        """
+        return self._max_id + 1
+
+    def add_book(self, title: str, author: str, year: int):
+        """
+        Добавляет новую книгу в библиотеку.
+
+        Args:
+            title (str): Название книги.
+            author (str): Автор книги.
+            year (int): Год издания книги.
+        """
+        try:
+            new_book = Book(self.generate_id(), title, author, year)
+        except ValueError as error:
+            print(error)
+            return
+        self.ids.append(new_book.id)
+        self.titles.append(new_book.title)
+        self.authors.append(new_book.author)
+        self.years.append(new_book.year)
+        self.statuses.append(new_book.status)
+        self._by_id[new_book.id] = len(self.ids) - 1
+        self._max_id = new_book.id
+        self._lc_titles.append(new_book.title.casefold())
+        self._lc_authors.append(new_book.author.casefold())
+        self._str_years.append(str(new_book.year))
+        bisect.insort(self._sorted_titles, (new_book.title.casefold(), len(self.ids) - 1))
+        self._mark_dirty()
+        print(f"Книга '{title}' добавлена с ID {new_book.id}.")
+
+    def delete_book(self, book_id: int):
+        """
+        Удаляет книгу из библиотеки.
+
+        Args:
+            book_id (int): Уникальный идентификатор книги.
+        """
+        idx = self._by_id.pop(book_id, None)
+        if idx is None:
+            print(f"Книга с ID {book_id} не найдена.")
+            return
+        for column in (self.ids, self.titles, self.authors, self.years, self.statuses):
+            column.pop(idx)
+        self._by_id = {bid: i for i, bid in enumerate(self.ids)}
+        self._rebuild_search_index()
+        self._mark_dirty()
+        print(f"Книга с ID {book_id} удалена.")
+
+    def _scan_indexes(self, q: str, field: str):
+        """
+        Выполняет поиск по колонкам и кэширует результат для повторных
+        запросов; кэш очищается при любой мутации библиотеки.
+
+        Args:
+            q (str): Запрос в нижнем регистре.
+            field (str): Поле для поиска.
+
+        Returns:
+            tuple: Кортеж индексов подходящих строк.
+        """
+        key = (q, field)
+        indexes = self._search_cache.get(key)
+        if indexes is None:
+            if field in ('title', 'author'):
+                indexes = tuple(self._substring_indexes(field, q))
+            else:
+                indexes = tuple(i for i, year in enumerate(self._str_years) if q in year)
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[key] = indexes
+        return indexes
+
+    def search_books(self, query: str, field: str):
+        """
+        Ищет книги в библиотеке по указанному полю и запросу.
+
+        Args:
+            query (str): Запрос для поиска.
+            field (str): Поле для поиска. Должно быть одним из 'title', 'author', 'year'.
+        """
+        indexes = self._scan_indexes(query.casefold(), field)
+        if indexes:
+            out = '\n'.join(repr(self._book_at(i).to_dict()) for i in indexes)
+            sys.stdout.write(out + '\n')
+        else:
+            print(f"Книги по запросу '{query}' не найдены.")
+
+    def display_books(self):
+        """
+        Отображает все книги в библиотеке.
+        """
+        if self.ids:
+            out = '\n'.join(repr(self._book_at(i).to_dict()) for i in range(len(self.ids)))
+            sys.stdout.write(out + '\n')
+        else:
+            print("В библиотеке нет книг.")
+
+    def change_status(self, book_id: int, new_status: str):
+        """
+        Изменяет статус книги в библиотеке.
+
+        Args:
+            book_id (int): Уникальный идентификатор книги.
+            new_status (str): Новый статус книги. Должен быть одним из 'в наличии', 'выдана'.
+        """
+        try:
+            status_code = STATUSES.index(new_status)
+        except ValueError:
+            print("Некорректный статус. Доступные статусы: 'в наличии', 'выдана'.")
+            return
+        idx = self._by_id.get(book_id)
+        if idx is None:
+            print(f"Книга с ID {book_id} не найдена.")
+            return
+        self.statuses[idx] = status_code
+        self._mark_dirty()
+        print(f"Статус книги с ID {book_id} изменен на '{new_status}'.")
+
+def handle_add(library):
+    """
+    Обрабатывает добавление книги через консоль.
+
+    Args:
+        library (Library): Объект библиотеки.
+    """
+    title = input("Введите название книги: ")
+    if library.title_exists(title):
+        print(f"Книга с названием '{title}' уже существует.")
+        title = input("Введите название книги ещё раз: ")
+    author = input("Введите автора книги: ")
+    year = input("Введите год издания книги: ")
+    if not year.isdigit():
+        year = input("Год должен быть числом!\nВведите год издания ещё раз: ")
+    library.add_book(title, author, int(year))
+
+def handle_delete(library):
+    """
+    Обрабатывает удаление книги через консоль.
+
+    Args:
+        library (Library): Объект библиотеки.
+    """
+    try:
+        book_id = int(input("Введите ID книги для удаления: "))
+        library.delete_book(book_id)
+    except ValueError:
+        print("Некорректный ID.")
+
+def handle_search(library):
+    """
+    Обрабатывает поиск книги через консоль.
+
+    Args:
+        library (Library): Объект библиотеки.
+    """
+    field = input("Введите поле для поиска из (title/author/year): ").strip().lower()
+    #Так как мы отображем ID при добавлении книги, считаю, что было бы хорошо добавить поиск и по ID
+    if field in ['title', 'author', 'year']:
+        query = input(f"Введите {field}: ").strip()
+        library.search_books(query, field)
+    else:
+        print("Некорректное поле для поиска.")
+
+def handle_display(library):
+    """
+    Обрабатывает показ всех книг через консоль.
+
+    Args:
+        library (Library): Объект библиотеки.
+    """
+    library.display_books()
+
+def handle_change_status(library):
+    """
+    Обрабатывает изменение статуса книги через консоль.
+
+    Args:
+        library (Library): Объект библиотеки.
+    """
+    try:
+        book_id = int(input("Введите ID книги для изменения статуса: "))
+        #Мне кажется, логичнее не спрашивать какой статус хочет установить пользователь, так как вариант всего 1)
+        new_status = input("Введите новый статус (в наличии/выдана): ").strip().lower()
+        library.change_status(book_id, new_status)
+    except ValueError:
+        print("Некорректный ID.")
+
+# Обработчики пунктов меню: один хешированный поиск вместо цепочки if/elif.
+HANDLERS = {
+    '1': handle_add,
+    '2': handle_delete,
+    '3': handle_search,
+    '4': handle_display,
+    '5': handle_change_status,
+}
+
+def main():
+    library = Library(DATA_FILE)
+
+    while True:
+        print("\nМеню:")
+        print("1. Добавить книгу")
+        print("2. Удалить книгу")
+        print("3. Искать книгу")
+        print("4. Показать все книги")
+        print("5. Изменить статус книги")
+        print("6. Выйти")
+        choice = input("Выберите опцию: ")
+
+        handler = HANDLERS.get(choice)
+        if handler is not None:
+            handler(library)
+        elif choice == '6':
+            break
+        else:
+            print("Выберите цифру от 1 до 6")
+
+if __name__ == "__main__":
+    main()